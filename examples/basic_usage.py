@@ -28,19 +28,18 @@ def create_sample_csv(filename):
     """
     Create a sample CSV file for demonstration
     """
-    # Create a sample dataset
+    # Create a sample dataset (format the shared timestamp once, not per row)
+    rng = np.random.default_rng()
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     data = {
         'id': list(range(1, 101)),
         'text': [
             f"This is sample text {i} with some variation and punctuation!!!" 
             for i in range(1, 101)
         ],
-        'category': np.random.choice(['business', 'tech', 'health', 'entertainment'], 100),
-        'timestamp': [
-            datetime.now().strftime('%Y-%m-%d %H:%M:%S') 
-            for _ in range(100)
-        ],
-        'score': np.random.uniform(0, 10, 100).round(2)
+        'category': rng.choice(['business', 'tech', 'health', 'entertainment'], 100),
+        'timestamp': [timestamp] * 100,
+        'score': rng.uniform(0, 10, 100).round(2)
     }
     
     # Create a DataFrame and save to CSV
@@ -54,15 +53,17 @@ def create_sample_json(filename):
     """
     Create a sample JSON file for demonstration
     """
-    # Create a sample dataset
+    # Create a sample dataset (format the shared timestamp once, not per row)
+    rng = np.random.default_rng()
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     data = []
     for i in range(1, 101):
         data.append({
             'id': i,
             'text': f"This is sample JSON text {i} with more information and details.",
-            'category': np.random.choice(['business', 'tech', 'health', 'entertainment']),
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'score': round(np.random.uniform(0, 10), 2),
+            'category': rng.choice(['business', 'tech', 'health', 'entertainment']),
+            'timestamp': timestamp,
+            'score': round(float(rng.uniform(0, 10)), 2),
             'metadata': {
                 'source': 'example',
                 'version': '1.0',
@@ -11,8 +11,7 @@ import time
 import json
 
 from llamadatasets import (
-    DataLoader,
-    FunctionTransformer
+    DataLoader
 )
 
 # Set up logging
@@ -28,40 +27,44 @@ def create_large_csv(filename, num_rows=100000):
     # Create a sample dataset with many rows
     logger.info(f"Creating large CSV file with {num_rows} rows...")
     
-    # Generate data in chunks to avoid memory issues
+    # Generate data in chunks to avoid memory issues, building each column
+    # as a whole NumPy array instead of looping row by row in Python
     chunk_size = 10000
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    rng = np.random.default_rng()
+    # Keep one file handle open for the whole write instead of reopening
+    # the file in append mode for every chunk
+    csv_file = open(filename, 'w', newline='')
     for chunk_idx in range(0, num_rows, chunk_size):
         end_idx = min(chunk_idx + chunk_size, num_rows)
         chunk_size_actual = end_idx - chunk_idx
-        
-        # Create chunk data
+
+        # Create chunk data with vectorized operations
+        ids = np.arange(chunk_idx + 1, end_idx + 1)
+        random_content = rng.random(chunk_size_actual)
         data = {
-            'id': list(range(chunk_idx + 1, end_idx + 1)),
-            'text': [
-                f"This is sample text {i} for streaming example with some random content {np.random.rand()}" 
-                for i in range(chunk_idx + 1, end_idx + 1)
-            ],
-            'category': np.random.choice(['business', 'tech', 'health', 'entertainment'], chunk_size_actual),
-            'timestamp': [
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S') 
-                for _ in range(chunk_size_actual)
-            ],
-            'value1': np.random.normal(100, 15, chunk_size_actual).round(2),
-            'value2': np.random.normal(50, 10, chunk_size_actual).round(2),
-            'value3': np.random.normal(25, 5, chunk_size_actual).round(2)
+            'id': ids,
+            'text': (
+                "This is sample text " + pd.Series(ids).astype(str)
+                + " for streaming example with some random content "
+                + pd.Series(random_content).astype(str)
+            ),
+            'category': rng.choice(['business', 'tech', 'health', 'entertainment'], chunk_size_actual),
+            'timestamp': np.full(chunk_size_actual, timestamp),
+            'value1': rng.normal(100, 15, chunk_size_actual).round(2),
+            'value2': rng.normal(50, 10, chunk_size_actual).round(2),
+            'value3': rng.normal(25, 5, chunk_size_actual).round(2)
         }
-        
+
         # Create a DataFrame for this chunk
         df = pd.DataFrame(data)
-        
-        # Write to CSV (append mode after first chunk)
-        if chunk_idx == 0:
-            df.to_csv(filename, index=False, mode='w')
-        else:
-            df.to_csv(filename, index=False, mode='a', header=False)
-        
+
+        # Write to the shared handle (header only for the first chunk)
+        df.to_csv(csv_file, index=False, header=(chunk_idx == 0))
+
         logger.info(f"  Wrote chunk {chunk_idx//chunk_size + 1}/{(num_rows-1)//chunk_size + 1}")
-    
+
+    csv_file.close()
     logger.info(f"Created large CSV file at {filename}")
     return filename
 
@@ -108,34 +111,29 @@ def main():
     
     # Example 2: Processing data in batches
     logger.info("\nExample 2: Processing data in batches")
-    
-    # Define a transformation to calculate derived values
-    def process_example(example):
-        # Add a derived field
-        example['avg_value'] = (example['value1'] + example['value2'] + example['value3']) / 3
-        return example
-    
-    # Initialize transformer
-    transformer = FunctionTransformer(process_example)
-    
-    # Process in batches
+
+    # Process in batches, consuming each batch in columnar (struct of
+    # arrays) form so the derived value is computed from the column lists
+    # directly instead of one dict lookup per field per row
     start_time = time.time()
-    
+
     # Statistics counters
     example_count = 0
     sum_avg_value = 0
-    
+
     # Process each batch
     logger.info("Processing in batches of 1000:")
-    for i, batch in enumerate(streaming_dataset.iter_batches(batch_size=1000)):
-        # Apply transformation to the batch
-        transformed_batch = transformer.batch_transform(batch)
-        
+    for i, batch in enumerate(streaming_dataset.iter_batches(batch_size=1000, as_columns=True)):
+        # Compute the derived field for the whole batch at once
+        avg_values = [
+            (value1 + value2 + value3) / 3
+            for value1, value2, value3 in zip(batch['value1'], batch['value2'], batch['value3'])
+        ]
+
         # Update statistics
-        for example in transformed_batch:
-            example_count += 1
-            sum_avg_value += example['avg_value']
-        
+        example_count += len(avg_values)
+        sum_avg_value += sum(avg_values)
+
         # Log progress occasionally
         if (i+1) % 10 == 0:
             logger.info(f"  Processed {example_count} examples so far...")
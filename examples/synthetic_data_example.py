@@ -99,11 +99,12 @@ def main():
         ]
     }
     
-    # Add additional fields
+    # Add additional fields (today's date is formatted once, not per example)
+    date_submitted = datetime.now().strftime("%Y-%m-%d")
     fields = {
         "priority": ["low", "medium", "high", "urgent"],
         "customer_id": lambda: f"CUST-{random.randint(10000, 99999)}",
-        "date_submitted": lambda: datetime.now().strftime("%Y-%m-%d"),
+        "date_submitted": [date_submitted],
         "response_time_hours": lambda: round(random.uniform(0, 72), 1)
     }
     
@@ -185,10 +186,9 @@ def main():
     for example in template_dataset:
         example['source'] = 'template'
     
-    # Combine datasets
+    # Combine datasets directly, without round-tripping through dict lists
     from llamadatasets import Dataset
-    combined_examples = random_dataset.to_dict_list() + template_dataset.to_dict_list()
-    combined_dataset = Dataset(combined_examples)
+    combined_dataset = Dataset.concat([random_dataset, template_dataset])
     
     logger.info(f"Combined dataset has {len(combined_dataset)} examples from multiple sources")
     
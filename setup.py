@@ -55,6 +55,11 @@ setup(
             "isort>=5.9.1",
             "tox>=3.24.0",
         ],
+        "performance": [
+            "google-re2>=1.0",
+            "orjson>=3.6.0",
+            "ijson>=3.1.0",
+        ],
         "nlp": [
             "nltk>=3.6.0",
             "spacy>=3.0.0",
@@ -1,77 +1,81 @@
 """
 LlamaDatasets: A library for dataset management and processing for LlamaSearch.ai applications
 """
+from typing import Any, List
+import importlib
 
 __version__ = "0.1.0"
 __author__ = "LlamaSearch.ai"
 __license__ = "MIT"
 
-# Import core components
-from llamadatasets.core import (
-    Dataset,
-    DataLoader,
-    CacheConfig,
-    StreamingDataset
-)
-
-# Import transformers
-from llamadatasets.transformers import (
-    BaseTransformer,
-    FunctionTransformer,
-    ColumnTransformer,
-    ChainTransformer,
-    TextCleanerTransformer,
-    TokenizerTransformer,
-    StopWordsRemoverTransformer,
-    TextStemmerTransformer,
-    TextLemmatizerTransformer
-)
-
-# Import splitters
-from llamadatasets.splitters import (
-    BaseSplitter,
-    RandomSplitter,
-    StratifiedSplitter,
-    TimeSplitter,
-    GroupSplitter,
-    CustomSplitter
-)
-
-# Import generators
-from llamadatasets.generators import (
-    BaseTextGenerator,
-    RandomTextGenerator,
-    TemplateTextGenerator
-)
-
-__all__ = [
+# Public names and the submodules that provide them. Imports are deferred
+# via PEP 562 module __getattr__ so `import llamadatasets` doesn't pull in
+# pandas/numpy/nltk until the first name from a submodule is actually used.
+_SUBMODULE_BY_NAME = {
     # Core
-    'Dataset',
-    'DataLoader',
-    'CacheConfig',
-    'StreamingDataset',
-    
+    'Dataset': 'llamadatasets.core',
+    'DataLoader': 'llamadatasets.core',
+    'CacheConfig': 'llamadatasets.core',
+    'StreamingDataset': 'llamadatasets.core',
+
     # Transformers
-    'BaseTransformer',
-    'FunctionTransformer',
-    'ColumnTransformer',
-    'ChainTransformer',
-    'TextCleanerTransformer',
-    'TokenizerTransformer',
-    'StopWordsRemoverTransformer',
-    'TextStemmerTransformer',
-    'TextLemmatizerTransformer',
-    
+    'BaseTransformer': 'llamadatasets.transformers',
+    'FunctionTransformer': 'llamadatasets.transformers',
+    'ColumnTransformer': 'llamadatasets.transformers',
+    'CachedTransformer': 'llamadatasets.transformers',
+    'ChainTransformer': 'llamadatasets.transformers',
+    'TextCleanerTransformer': 'llamadatasets.transformers',
+    'TokenizerTransformer': 'llamadatasets.transformers',
+    'StopWordsRemoverTransformer': 'llamadatasets.transformers',
+    'TextStemmerTransformer': 'llamadatasets.transformers',
+    'TextLemmatizerTransformer': 'llamadatasets.transformers',
+
     # Splitters
-    'BaseSplitter',
-    'RandomSplitter',
-    'StratifiedSplitter',
-    'TimeSplitter',
-    'GroupSplitter',
-    'CustomSplitter',
-    
+    'BaseSplitter': 'llamadatasets.splitters',
+    'RandomSplitter': 'llamadatasets.splitters',
+    'StratifiedSplitter': 'llamadatasets.splitters',
+    'TimeSplitter': 'llamadatasets.splitters',
+    'GroupSplitter': 'llamadatasets.splitters',
+    'CustomSplitter': 'llamadatasets.splitters',
+
     # Generators
-    'BaseTextGenerator',
-    'RandomTextGenerator',
-    'TemplateTextGenerator'
-] 
\ No newline at end of file
+    'BaseTextGenerator': 'llamadatasets.generators',
+    'RandomTextGenerator': 'llamadatasets.generators',
+    'TemplateTextGenerator': 'llamadatasets.generators',
+}
+
+__all__ = list(_SUBMODULE_BY_NAME)
+
+# Submodules that the eager imports used to bind as package attributes
+# (llamadatasets.core etc.); kept addressable lazily as well
+_SUBMODULES = ('core', 'transformers', 'splitters', 'generators')
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve a public name by importing its submodule on first access.
+
+    Args:
+        name: The attribute being looked up
+
+    Returns:
+        Any: The resolved object, cached on the package module
+    """
+    if name in _SUBMODULE_BY_NAME:
+        module = importlib.import_module(_SUBMODULE_BY_NAME[name])
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so __getattr__ only runs once per name
+        return value
+    if name in _SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """
+    Include the lazily-exported names in dir(llamadatasets).
+
+    Returns:
+        List[str]: The module's attributes plus all public re-exports
+    """
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
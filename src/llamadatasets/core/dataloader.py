@@ -234,7 +234,17 @@ class DataLoader:
                 **self.kwargs
             )
         else:
-            # Load the entire CSV into memory
+            # Load the entire CSV into memory. pyarrow's multi-threaded CSV
+            # reader is considerably faster than pandas and allocates less,
+            # but only pandas understands read_csv keyword arguments, so the
+            # fast path is reserved for plain loads.
+            if not self.kwargs:
+                try:
+                    import pyarrow.csv as pa_csv
+                    table = pa_csv.read_csv(self.source_path)
+                    return Dataset.from_columns(table.to_pydict())
+                except ImportError:
+                    pass
             df = pd.read_csv(self.source_path, **self.kwargs)
             data = df.to_dict('records')
             return Dataset(data)
@@ -254,10 +264,20 @@ class DataLoader:
                 **self.kwargs
             )
         else:
-            # Load the entire JSON into memory
-            with open(self.source_path, 'r') as f:
-                data = json.load(f, **self.kwargs)
-            
+            # Load the entire JSON into memory. orjson decodes in native
+            # code when installed; json.load kwargs force the stdlib path.
+            if not self.kwargs:
+                try:
+                    import orjson
+                    with open(self.source_path, 'rb') as f:
+                        data = orjson.loads(f.read())
+                except ImportError:
+                    with open(self.source_path, 'r') as f:
+                        data = json.load(f)
+            else:
+                with open(self.source_path, 'r') as f:
+                    data = json.load(f, **self.kwargs)
+
             # Ensure data is a list
             if isinstance(data, dict):
                 # Handle case where JSON is an object with a data field
@@ -284,7 +304,15 @@ class DataLoader:
                 **self.kwargs
             )
         else:
-            # Load the entire Parquet file into memory
+            # Load the entire Parquet file into memory, keeping the columnar
+            # layout when no pandas-specific keyword arguments were given
+            if not self.kwargs:
+                try:
+                    import pyarrow.parquet as pq
+                    table = pq.read_table(self.source_path)
+                    return Dataset.from_columns(table.to_pydict())
+                except ImportError:
+                    pass
             df = pd.read_parquet(self.source_path, **self.kwargs)
             data = df.to_dict('records')
             return Dataset(data)
@@ -332,9 +360,15 @@ class DataLoader:
         key_components = [
             self.source_type,
             str(self.source_path),
-            json.dumps(self.kwargs, sort_keys=True)
+            json.dumps(self.kwargs, sort_keys=True, default=str)
         ]
-        
+
+        # For file sources, fold the file's mtime and size into the key so
+        # an edited source file misses the cache instead of serving stale data
+        if self.source_path and os.path.isfile(self.source_path):
+            stat = os.stat(self.source_path)
+            key_components.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+
         key_str = "_".join(key_components)
         return hashlib.md5(key_str.encode()).hexdigest()
     
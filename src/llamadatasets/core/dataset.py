@@ -2,12 +2,17 @@
 Dataset is the core data structure of LlamaDatasets
 """
 from typing import List, Dict, Any, Optional, Union, Callable, Iterator, TypeVar, Generic
+import multiprocessing
+import logging
+import pickle
 import random
 import json
 import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field, validator
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar('T')
 
 
@@ -25,58 +30,261 @@ class Dataset(Generic[T]):
         """
         self._data = data
         self._index = list(range(len(data)))
-    
+        self._pending_ops: List[tuple] = []
+        self._columns: Optional[Dict[str, List[Any]]] = None
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, List[Any]]) -> 'Dataset':
+        """
+        Create a Dataset from a column-oriented mapping.
+
+        The dataset keeps the columnar (struct-of-arrays) storage, so
+        column-level access such as get_column and to_pandas avoids
+        building per-row dictionaries; rows are only materialized when a
+        row-level API is used.
+
+        Args:
+            columns: Mapping of column name to list of values (all the
+                same length)
+
+        Returns:
+            Dataset: A columnar-backed dataset
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length, got {sorted(lengths)}")
+
+        dataset = cls.__new__(cls)
+        dataset._data = None
+        dataset._index = list(range(lengths.pop() if lengths else 0))
+        dataset._pending_ops = []
+        dataset._columns = dict(columns)
+        return dataset
+
     def __len__(self) -> int:
         """
         Get the number of examples in the dataset.
-        
+
         Returns:
             int: The number of examples
         """
+        if not self._pending_ops:
+            return len(self._index)
+        self._ensure_materialized()
         return len(self._data)
-    
+
     def __getitem__(self, idx: Union[int, slice]) -> Union[T, List[T]]:
         """
         Get an example or slice of examples by index.
-        
+
         Args:
             idx: Integer index or slice
 
         Returns:
             The example or list of examples
         """
+        self._ensure_materialized()
         if isinstance(idx, slice):
             indices = self._index[idx]
             return [self._data[i] for i in indices]
         else:
             return self._data[self._index[idx]]
     
-    def filter(self, filter_fn: Callable[[T], bool]) -> 'Dataset[T]':
+    def filter(self, filter_fn: Callable[[T], bool], num_proc: Optional[int] = None) -> 'Dataset[T]':
         """
         Filter the dataset using a predicate function.
-        
+
         Args:
             filter_fn: Function that takes an example and returns True to keep it or False to filter it out
+            num_proc: Number of worker processes to evaluate the predicate with
+                (the predicate must be picklable; None or 1 runs in-process)
 
         Returns:
             Dataset: A new filtered dataset
         """
-        filtered_data = [self._data[i] for i in self._index if filter_fn(self._data[i])]
+        self._ensure_materialized()
+        examples = [self._data[i] for i in self._index]
+        if num_proc and num_proc > 1 and len(examples) > 1:
+            mask = self._pool_map(filter_fn, examples, num_proc)
+            filtered_data = [example for example, keep in zip(examples, mask) if keep]
+        else:
+            filtered_data = [example for example in examples if filter_fn(example)]
         return Dataset(filtered_data)
-    
-    def map(self, map_fn: Callable[[T], Any]) -> 'Dataset':
+
+    def map(self, map_fn: Callable[[T], Any], num_proc: Optional[int] = None) -> 'Dataset':
         """
         Apply a function to each example in the dataset.
-        
+
         Args:
             map_fn: Function to apply to each example
+            num_proc: Number of worker processes to map with (the function
+                must be picklable; None or 1 runs in-process)
 
         Returns:
             Dataset: A new dataset with transformed examples
         """
-        mapped_data = [map_fn(self._data[i]) for i in self._index]
+        self._ensure_materialized()
+        examples = [self._data[i] for i in self._index]
+        if num_proc and num_proc > 1 and len(examples) > 1:
+            mapped_data = self._pool_map(map_fn, examples, num_proc)
+        else:
+            mapped_data = [map_fn(example) for example in examples]
         return Dataset(mapped_data)
+
+    def lazy_map(self, map_fn: Callable[[T], Any]) -> 'Dataset':
+        """
+        Queue a map to run when the dataset is next accessed.
+
+        Unlike map, no intermediate list is built: consecutive lazy_map and
+        lazy_filter calls are fused into a single pass over the data at
+        materialization time.
+
+        Args:
+            map_fn: Function to apply to each example
+
+        Returns:
+            Dataset: A dataset with the map queued
+        """
+        return self._with_pending_op(('map', map_fn))
+
+    def lazy_filter(self, filter_fn: Callable[[T], bool]) -> 'Dataset[T]':
+        """
+        Queue a filter to run when the dataset is next accessed.
+
+        Unlike filter, no intermediate list is built: consecutive lazy_map
+        and lazy_filter calls are fused into a single pass over the data at
+        materialization time.
+
+        Args:
+            filter_fn: Function that returns True to keep an example
+
+        Returns:
+            Dataset: A dataset with the filter queued
+        """
+        return self._with_pending_op(('filter', filter_fn))
+
+    def _with_pending_op(self, op: tuple) -> 'Dataset':
+        """
+        Create a dataset that shares this one's data with one more queued op.
+
+        Args:
+            op: ('map' or 'filter', callable) pair to queue
+
+        Returns:
+            Dataset: The new dataset with the op appended to its chain
+        """
+        result = Dataset.__new__(Dataset)
+        result._data = self._data
+        result._index = self._index
+        result._pending_ops = self._pending_ops + [op]
+        result._columns = self._columns
+        return result
+
+    def materialize(self) -> 'Dataset':
+        """
+        Apply any queued lazy operations, fused into a single pass.
+
+        Returns:
+            Dataset: This dataset, with all queued operations applied
+        """
+        self._ensure_materialized()
+        return self
+
+    def _ensure_materialized(self) -> None:
+        """
+        Build row storage from columns and run any queued lazy operations.
+        """
+        if self._data is None:
+            # Materialize row dictionaries from the columnar storage
+            keys = list(self._columns)
+            self._data = [dict(zip(keys, values)) for values in zip(*self._columns.values())]
+
+        if not self._pending_ops:
+            return
+
+        ops, self._pending_ops = self._pending_ops, []
+        self._columns = None  # Rows are about to change; drop the column cache
+        materialized = []
+        for i in self._index:
+            example = self._data[i]
+            keep = True
+            for kind, fn in ops:
+                if kind == 'map':
+                    example = fn(example)
+                elif not fn(example):
+                    keep = False
+                    break
+            if keep:
+                materialized.append(example)
+
+        self._data = materialized
+        self._index = list(range(len(materialized)))
+
+    @staticmethod
+    def _pool_map(fn: Callable[[T], Any], examples: List[T], num_proc: int) -> List[Any]:
+        """
+        Run a function over examples with a process pool in chunked shards.
+
+        Functions that cannot be pickled (lambdas, locally defined closures)
+        cannot be shipped to worker processes, so those fall back to a
+        single-process loop with a warning instead of raising.
+
+        Args:
+            fn: Function to apply to each example
+            examples: Examples to process
+            num_proc: Number of worker processes
+
+        Returns:
+            List[Any]: The results in input order
+        """
+        try:
+            pickle.dumps(fn)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            logger.warning(
+                "num_proc=%d requested but the function is not picklable "
+                "(e.g. a lambda or local closure); running in a single process",
+                num_proc,
+            )
+            return [fn(example) for example in examples]
+
+        # Shard the work into a handful of chunks per worker so pickling
+        # overhead is paid per chunk rather than per example
+        chunksize = max(1, len(examples) // (num_proc * 4))
+        with multiprocessing.Pool(num_proc) as pool:
+            return pool.map(fn, examples, chunksize=chunksize)
     
+    @classmethod
+    def concat(cls, datasets: List['Dataset']) -> 'Dataset':
+        """
+        Concatenate multiple datasets into one.
+
+        Examples are gathered directly from each dataset's storage in a
+        single pass, without the to_dict_list round trip per source.
+
+        Args:
+            datasets: The datasets to concatenate, in order
+
+        Returns:
+            Dataset: A new dataset containing all examples
+        """
+        data: List[Any] = []
+        for dataset in datasets:
+            dataset._ensure_materialized()
+            data.extend(dataset._data[i] for i in dataset._index)
+        return cls(data)
+
+    def __add__(self, other: 'Dataset') -> 'Dataset':
+        """
+        Concatenate two datasets with the + operator.
+
+        Args:
+            other: The dataset to append
+
+        Returns:
+            Dataset: A new dataset containing examples from both
+        """
+        return Dataset.concat([self, other])
+
     def transform(self, transformers: List[Any]) -> 'Dataset':
         """
         Apply a sequence of transformers to the dataset.
@@ -103,6 +311,7 @@ class Dataset(Generic[T]):
         Returns:
             The sampled example or list of examples
         """
+        self._ensure_materialized()
         if seed is not None:
             random.seed(seed)
         
@@ -114,14 +323,31 @@ class Dataset(Generic[T]):
             sampled_indices = random.sample(self._index, n)
             return [self._data[i] for i in sampled_indices]
     
-    def to_pandas(self) -> pd.DataFrame:
+    def to_pandas(self, category_columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Convert the dataset to a pandas DataFrame.
-        
+
+        Args:
+            category_columns: Optional list of low-cardinality columns (e.g.
+                labels like 'category' or 'priority') to store as the pandas
+                category dtype, which keeps integer codes instead of repeated
+                strings and makes groupby/value_counts on them much faster
+
         Returns:
             pd.DataFrame: The dataset as a DataFrame
         """
-        return pd.DataFrame([self._data[i] for i in self._index])
+        if self._columns is not None and not self._pending_ops:
+            df = pd.DataFrame(self._columns)
+        else:
+            self._ensure_materialized()
+            df = pd.DataFrame([self._data[i] for i in self._index])
+
+        if category_columns:
+            for column in category_columns:
+                if column in df.columns:
+                    df[column] = df[column].astype('category')
+
+        return df
     
     def to_dict_list(self) -> List[Dict[str, Any]]:
         """
@@ -130,6 +356,7 @@ class Dataset(Generic[T]):
         Returns:
             List[Dict[str, Any]]: The dataset as a list of dictionaries
         """
+        self._ensure_materialized()
         # If the data is already a list of dictionaries, just return it
         # Otherwise, try to convert each item to a dictionary
         if all(isinstance(self._data[i], dict) for i in self._index):
@@ -163,6 +390,11 @@ class Dataset(Generic[T]):
         Returns:
             List[Any]: List of values for the specified column
         """
+        if self._columns is not None and not self._pending_ops:
+            if column not in self._columns:
+                raise KeyError(f"Column '{column}' not found in dataset item")
+            return list(self._columns[column])
+        self._ensure_materialized()
         values = []
         for i in self._index:
             item = self._data[i]
@@ -184,22 +416,41 @@ class Dataset(Generic[T]):
         Returns:
             Dataset: A new dataset with the first n examples
         """
+        self._ensure_materialized()
         n = min(n, len(self))
         return Dataset([self._data[i] for i in self._index[:n]])
     
-    def iter_batches(self, batch_size: int = 32) -> Iterator[List[T]]:
+    def iter_batches(self, batch_size: int = 32, as_columns: bool = False) -> Iterator[Union[List[T], Dict[str, List[Any]]]]:
         """
         Iterate over the dataset in batches.
-        
+
         Args:
             batch_size: Size of each batch
+            as_columns: Yield each batch as a single column-to-values
+                mapping (struct of arrays) instead of a list of per-row
+                dicts, avoiding one dict allocation per row. Columns are
+                the union of the batch's keys; rows missing a key get None
 
         Yields:
-            List[T]: Batch of examples
+            Union[List[T], Dict[str, List[Any]]]: Batch of examples
         """
+        if as_columns and self._columns is not None and not self._pending_ops:
+            # Columnar storage: batches are plain slices of each column
+            for i in range(0, len(self._index), batch_size):
+                yield {name: values[i:i + batch_size] for name, values in self._columns.items()}
+            return
+
+        self._ensure_materialized()
         for i in range(0, len(self), batch_size):
             indices = self._index[i:i + batch_size]
-            yield [self._data[j] for j in indices]
+            batch = [self._data[j] for j in indices]
+            if as_columns and batch:
+                # Union the keys across the batch so heterogeneous records
+                # transpose cleanly; rows without a key contribute None
+                keys = dict.fromkeys(key for example in batch for key in example)
+                yield {key: [example.get(key) for example in batch] for key in keys}
+            else:
+                yield batch
     
     def split(self, ratio: float = 0.8, seed: Optional[int] = None) -> tuple['Dataset[T]', 'Dataset[T]']:
         """
@@ -225,14 +476,30 @@ class Dataset(Generic[T]):
             path: Path to save the file
             format: Format of the file ("json", "csv", or "parquet")
         """
+        self._ensure_materialized()
         data = [self._data[i] for i in self._index]
         
         if format.lower() == "json":
-            with open(path, "w") as f:
-                json.dump(data, f)
+            # orjson serializes in native code, several times faster than
+            # the stdlib encoder; fall back when it is not installed or the
+            # data holds types only the stdlib encoder accepts
+            try:
+                import orjson
+                with open(path, "wb") as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
+            except (ImportError, TypeError):
+                with open(path, "w") as f:
+                    json.dump(data, f)
         elif format.lower() == "csv":
-            df = pd.DataFrame(data)
-            df.to_csv(path, index=False)
+            try:
+                import pyarrow as pa
+                import pyarrow.csv as pa_csv
+                pa_csv.write_csv(pa.Table.from_pylist(data), path)
+            except Exception:
+                # pyarrow missing, or data (e.g. nested dicts) that its CSV
+                # writer cannot represent
+                df = pd.DataFrame(data)
+                df.to_csv(path, index=False)
         elif format.lower() == "parquet":
             df = pd.DataFrame(data)
             df.to_parquet(path, index=False)
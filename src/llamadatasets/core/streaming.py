@@ -5,6 +5,8 @@ from typing import List, Dict, Any, Optional, Union, Callable, Iterator, Generat
 import os
 import json
 import logging
+import queue
+import threading
 import pandas as pd
 import pyarrow.parquet as pq
 import numpy as np
@@ -106,15 +108,22 @@ class StreamingDataset:
         for batch in self.iter_batches(batch_size=1):
             yield batch[0]
     
-    def iter_batches(self, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+    def iter_batches(self, batch_size: int = 1000, prefetch: int = 0, as_columns: bool = False) -> Iterator[Union[List[Dict[str, Any]], Dict[str, List[Any]]]]:
         """
         Iterate through the dataset in batches.
-        
+
         Args:
             batch_size: Size of batches to yield
+            prefetch: Number of batches to read ahead on a background
+                thread, overlapping I/O and parsing with the consumer's
+                processing (0 reads synchronously)
+            as_columns: Yield each batch as a single column-to-values
+                mapping (struct of arrays) instead of a list of per-row
+                dicts. Columns are the union of the batch's keys; rows
+                missing a key get None
 
         Yields:
-            List[Dict[str, Any]]: A batch of examples
+            Union[List[Dict[str, Any]], Dict[str, List[Any]]]: A batch of examples
         """
         # Determine which iterator to use based on source type
         if self.source_type == "csv":
@@ -127,16 +136,101 @@ class StreamingDataset:
             iterator = self._iter_database_batches(batch_size)
         else:
             raise ValueError(f"Unsupported source type: {self.source_type}")
-        
+
+        # Transpose batches into struct-of-arrays form if requested. The
+        # keys are unioned across each batch so heterogeneous records (valid
+        # in JSON sources) transpose cleanly, with None filling the gaps
+        if as_columns:
+            iterator = (
+                {
+                    key: [example.get(key) for example in batch]
+                    for key in dict.fromkeys(
+                        key for example in batch for key in example
+                    )
+                }
+                for batch in iterator if batch
+            )
+
+        # Overlap loading with downstream processing if requested
+        if prefetch > 0:
+            iterator = self._iter_prefetched(iterator, prefetch)
+
         # Wrap with progress bar if requested
         if self.progress_bar and self.total_rows > 0:
             with tqdm(total=self.total_rows) as pbar:
                 for batch in iterator:
-                    pbar.update(len(batch))
+                    if as_columns:
+                        pbar.update(len(next(iter(batch.values()), [])))
+                    else:
+                        pbar.update(len(batch))
                     yield batch
         else:
             yield from iterator
     
+    @staticmethod
+    def _iter_prefetched(iterator: Iterator[List[Dict[str, Any]]], buffer_size: int) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Drain an iterator on a background thread through a bounded queue.
+
+        The producer thread keeps up to buffer_size batches ready while the
+        consumer processes the current one; producer exceptions are re-raised
+        in the consumer. If the consumer stops iterating early (e.g. breaks
+        out after sampling a few batches), closing the generator signals the
+        producer to stop and joins it so neither the thread nor the
+        underlying source handle is leaked.
+
+        Args:
+            iterator: The batch iterator to read ahead from
+            buffer_size: Maximum number of batches to buffer
+
+        Yields:
+            List[Dict[str, Any]]: A batch of examples
+        """
+        batch_queue: queue.Queue = queue.Queue(maxsize=buffer_size)
+        sentinel = object()
+        stop = threading.Event()
+
+        def producer():
+            try:
+                for batch in iterator:
+                    # put with a timeout so a consumer that went away can
+                    # still unblock us via the stop flag
+                    while not stop.is_set():
+                        try:
+                            batch_queue.put(batch, timeout=0.1)
+                            break
+                        except queue.Full:
+                            continue
+                    if stop.is_set():
+                        return
+            except BaseException as e:
+                if not stop.is_set():
+                    batch_queue.put(e)
+                return
+            batch_queue.put(sentinel)
+
+        thread = threading.Thread(target=producer, daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                item = batch_queue.get()
+                if item is sentinel:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            # Drain anything the producer buffered so a pending put() with
+            # the queue full can't outlive the stop check
+            while True:
+                try:
+                    batch_queue.get_nowait()
+                except queue.Empty:
+                    break
+            thread.join()
+
     def _iter_csv_batches(self, batch_size: int) -> Generator[List[Dict[str, Any]], None, None]:
         """
         Iterate through a CSV file in batches.
@@ -147,6 +241,21 @@ class StreamingDataset:
         Yields:
             List[Dict[str, Any]]: A batch of examples
         """
+        # Prefer pyarrow's incremental CSV reader, which parses in native
+        # code with a bounded read-ahead buffer. Loads that pass pandas
+        # keyword arguments fall back to pandas chunking.
+        if not self.kwargs:
+            try:
+                import pyarrow.csv as pa_csv
+                with pa_csv.open_csv(self.source_path) as reader:
+                    for chunk in reader:
+                        records = chunk.to_pylist()
+                        for i in range(0, len(records), batch_size):
+                            yield records[i:i + batch_size]
+                return
+            except ImportError:
+                pass
+
         for chunk in pd.read_csv(self.source_path, chunksize=self.chunk_size, **self.kwargs):
             # Process the chunk in smaller batches
             records = chunk.to_dict('records')
@@ -163,11 +272,41 @@ class StreamingDataset:
         Yields:
             List[Dict[str, Any]]: A batch of examples
         """
-        # For JSON, we currently load the whole file into memory
-        # This could be improved for line-delimited JSON
-        with open(self.source_path, 'r') as f:
-            data = json.load(f, **self.kwargs)
-        
+        # Stream top-level array items incrementally with ijson when it is
+        # installed, so only one batch is resident at a time
+        if not self.kwargs and self._json_is_array():
+            try:
+                import ijson
+            except ImportError:
+                ijson = None
+
+            if ijson is not None:
+                with open(self.source_path, 'rb') as f:
+                    batch = []
+                    # use_float keeps numbers as float like json.load,
+                    # instead of ijson's default decimal.Decimal
+                    for item in ijson.items(f, 'item', use_float=True):
+                        batch.append(item)
+                        if len(batch) >= batch_size:
+                            yield batch
+                            batch = []
+                    if batch:
+                        yield batch
+                return
+
+        # Otherwise load the whole file, decoding with orjson when possible
+        if not self.kwargs:
+            try:
+                import orjson
+                with open(self.source_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            except ImportError:
+                with open(self.source_path, 'r') as f:
+                    data = json.load(f)
+        else:
+            with open(self.source_path, 'r') as f:
+                data = json.load(f, **self.kwargs)
+
         # Ensure data is a list
         if isinstance(data, dict):
             if 'data' in data and isinstance(data['data'], list):
@@ -178,7 +317,21 @@ class StreamingDataset:
         # Yield in batches
         for i in range(0, len(data), batch_size):
             yield data[i:i + batch_size]
-    
+
+    def _json_is_array(self) -> bool:
+        """
+        Check whether the JSON source's top-level value is an array.
+
+        Returns:
+            bool: True if the first non-whitespace byte is '['
+        """
+        try:
+            with open(self.source_path, 'rb') as f:
+                chunk = f.read(64)
+            return chunk.lstrip()[:1] == b'['
+        except OSError:
+            return False
+
     def _iter_parquet_batches(self, batch_size: int) -> Generator[List[Dict[str, Any]], None, None]:
         """
         Iterate through a Parquet file in batches.
@@ -70,12 +70,12 @@ class RandomTextGenerator(BaseTextGenerator):
         self.include_punctuation = include_punctuation
         self.categories = categories
         self.include_metadata = include_metadata
-        
-        # Set random seed if provided
-        if seed is not None:
-            random.seed(seed)
-            np.random.seed(seed)
-        
+
+        # Per-instance generators seeded once, instead of reseeding the
+        # global random/np.random state on every construction
+        self._random = random.Random(seed)
+        self._rng = np.random.default_rng(seed)
+
         # Punctuation to choose from
         self.punctuation = ['.', ',', '!', '?', ';', ':']
     
@@ -86,8 +86,8 @@ class RandomTextGenerator(BaseTextGenerator):
         Returns:
             str: A random word
         """
-        length = random.randint(self.word_length_range[0], self.word_length_range[1])
-        return ''.join(random.choice(string.ascii_lowercase) for _ in range(length))
+        length = self._random.randint(self.word_length_range[0], self.word_length_range[1])
+        return ''.join(self._random.choice(string.ascii_lowercase) for _ in range(length))
     
     def _generate_text(self) -> str:
         """
@@ -96,7 +96,7 @@ class RandomTextGenerator(BaseTextGenerator):
         Returns:
             str: Random text with the specified properties
         """
-        num_words = random.randint(self.min_words, self.max_words)
+        num_words = self._random.randint(self.min_words, self.max_words)
         words = []
         
         for i in range(num_words):
@@ -109,12 +109,12 @@ class RandomTextGenerator(BaseTextGenerator):
             words.append(word)
             
             # Add punctuation occasionally
-            if self.include_punctuation and i < num_words - 1 and random.random() < 0.1:
-                words[-1] += random.choice(self.punctuation)
+            if self.include_punctuation and i < num_words - 1 and self._random.random() < 0.1:
+                words[-1] += self._random.choice(self.punctuation)
         
         # Add final punctuation
         if self.include_punctuation:
-            words[-1] += random.choice(['.', '!', '?'])
+            words[-1] += self._random.choice(['.', '!', '?'])
         
         return ' '.join(words)
     
@@ -126,20 +126,20 @@ class RandomTextGenerator(BaseTextGenerator):
             Dict[str, Any]: A dictionary with random text and optional fields
         """
         example = {
-            'id': random.randint(1, 1000000),
+            'id': int(self._rng.integers(1, 1000001)),
             'text': self._generate_text()
         }
         
         # Add a category if specified
         if self.categories:
-            example['category'] = random.choice(self.categories)
+            example['category'] = self._random.choice(self.categories)
         
         # Add random metadata if specified
         if self.include_metadata:
             example['metadata'] = {
-                'source': f'generator-{random.randint(1, 5)}',
-                'created_at': f'2023-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}',
-                'score': round(random.uniform(0, 10), 2)
+                'source': f'generator-{self._random.randint(1, 5)}',
+                'created_at': f'2023-{self._random.randint(1, 12):02d}-{self._random.randint(1, 28):02d}',
+                'score': round(float(self._rng.uniform(0, 10)), 2)
             }
         
         return example
@@ -167,15 +167,18 @@ class TemplateTextGenerator(BaseTextGenerator):
         self.templates = templates
         self.variables = variables
         self.fields = fields or {}
-        
-        # Set random seed if provided
-        if seed is not None:
-            random.seed(seed)
-            np.random.seed(seed)
-        
-        # Validate that all variables in templates exist in variables dict
+
+        # Per-instance generators seeded once, instead of reseeding the
+        # global random/np.random state on every construction
+        self._random = random.Random(seed)
+        self._rng = np.random.default_rng(seed)
+
+        # Validate that all variables in templates exist in variables dict,
+        # caching the extracted names so templates are only parsed once
+        self._template_variables = {}
         for template in templates:
-            for var_name in self._extract_variables(template):
+            self._template_variables[template] = self._extract_variables(template)
+            for var_name in self._template_variables[template]:
                 if var_name not in variables:
                     raise ValueError(f"Variable '{var_name}' in template not found in variables dict")
     
@@ -203,10 +206,10 @@ class TemplateTextGenerator(BaseTextGenerator):
             str: Template with variables replaced by values
         """
         result = template
-        for var_name in self._extract_variables(template):
-            value = random.choice(self.variables[var_name])
+        for var_name in self._template_variables[template]:
+            value = self._random.choice(self.variables[var_name])
             result = result.replace(f"{{{var_name}}}", value)
-        
+
         return result
     
     def generate_example(self) -> Dict[str, Any]:
@@ -216,11 +219,11 @@ class TemplateTextGenerator(BaseTextGenerator):
         Returns:
             Dict[str, Any]: A dictionary with text generated from templates
         """
-        template = random.choice(self.templates)
+        template = self._random.choice(self.templates)
         text = self._fill_template(template)
         
         example = {
-            'id': random.randint(1, 1000000),
+            'id': int(self._rng.integers(1, 1000001)),
             'text': text
         }
         
@@ -231,6 +234,48 @@ class TemplateTextGenerator(BaseTextGenerator):
                 example[field_name] = field_values()
             else:
                 # Choose a random value from the list
-                example[field_name] = random.choice(field_values)
-        
-        return example 
\ No newline at end of file
+                example[field_name] = self._random.choice(field_values)
+
+        return example
+
+    def generate(self, num_examples: int) -> Dataset:
+        """
+        Generate multiple examples with one batch of random draws per field.
+
+        Templates, template variables, and list-valued fields are each drawn
+        with a single random.choices call for the whole batch rather than one
+        choice per example, so per-example work is just string substitution.
+
+        Args:
+            num_examples: Number of examples to generate
+
+        Returns:
+            Dataset: A dataset containing the generated examples
+        """
+        templates = self._random.choices(self.templates, k=num_examples)
+        variable_draws = {
+            name: self._random.choices(values, k=num_examples)
+            for name, values in self.variables.items()
+        }
+        field_draws = {
+            name: values if callable(values) else self._random.choices(values, k=num_examples)
+            for name, values in self.fields.items()
+        }
+
+        examples = []
+        for i, template in enumerate(templates):
+            text = template
+            for var_name in self._template_variables[template]:
+                text = text.replace(f"{{{var_name}}}", variable_draws[var_name][i])
+
+            example = {
+                'id': int(self._rng.integers(1, 1000001)),
+                'text': text
+            }
+
+            for field_name, draw in field_draws.items():
+                example[field_name] = draw() if callable(draw) else draw[i]
+
+            examples.append(example)
+
+        return Dataset(examples) 
\ No newline at end of file
@@ -71,23 +71,22 @@ class RandomSplitter(BaseSplitter):
         Returns:
             Dict[str, Dataset]: Dictionary with 'train', 'val', and 'test' splits
         """
-        # Get all examples and shuffle
+        # Draw a random permutation of indices instead of shuffling the
+        # example list in place; the examples themselves are never moved
         examples = dataset.to_dict_list()
-        
-        if self.seed is not None:
-            random.seed(self.seed)
-        
-        random.shuffle(examples)
-        
-        # Calculate split indices
         n = len(examples)
+
+        rng = np.random.default_rng(self.seed)
+        order = rng.permutation(n)
+
+        # Calculate split indices
         train_end = int(n * self.train_size)
         val_end = train_end + int(n * self.val_size)
-        
-        # Split the dataset
-        train_examples = examples[:train_end]
-        val_examples = examples[train_end:val_end]
-        test_examples = examples[val_end:]
+
+        # Split the dataset via views of the permutation
+        train_examples = [examples[i] for i in order[:train_end]]
+        val_examples = [examples[i] for i in order[train_end:val_end]]
+        test_examples = [examples[i] for i in order[val_end:]]
         
         return {
             'train': Dataset(train_examples),
@@ -141,16 +140,13 @@ class StratifiedSplitter(BaseSplitter):
         # Group examples by label
         examples = dataset.to_dict_list()
         labels_to_examples = {}
-        
+        label_column = self.label_column
+
         for example in examples:
-            if self.label_column not in example:
-                raise KeyError(f"Label column '{self.label_column}' not found in example")
-            
-            label = example[self.label_column]
-            if label not in labels_to_examples:
-                labels_to_examples[label] = []
-            
-            labels_to_examples[label].append(example)
+            if label_column not in example:
+                raise KeyError(f"Label column '{label_column}' not found in example")
+
+            labels_to_examples.setdefault(example[label_column], []).append(example)
         
         # Set random seed
         if self.seed is not None:
@@ -6,6 +6,7 @@ from llamadatasets.transformers.base import (
     BaseTransformer,
     FunctionTransformer,
     ColumnTransformer,
+    CachedTransformer,
     ChainTransformer
 )
 
@@ -22,6 +23,7 @@ __all__ = [
     'BaseTransformer',
     'FunctionTransformer',
     'ColumnTransformer',
+    'CachedTransformer',
     'ChainTransformer',
     
     # Text transformers
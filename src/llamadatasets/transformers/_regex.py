@@ -0,0 +1,51 @@
+"""
+Regex backend shim for the text transformers.
+
+Prefers the ``google-re2`` package (a linear-time, natively compiled engine)
+when it is installed, falling back to the standard library ``re`` module.
+Patterns that use constructs re2 does not support (lookarounds, backreferences,
+conditionals) are compiled with ``re`` automatically, as are patterns whose
+meaning would change between engines: the Perl character classes ``\d``, ``\s``,
+``\w`` (and their negations and ``\b``) are Unicode-aware in the stdlib but
+ASCII-only in re2. Callers can therefore pass any pattern without worrying
+about the active backend changing the matches.
+
+The backend can be disabled explicitly by setting the environment variable
+``LLAMADATASETS_USE_RE2=0``, which forces the stdlib engine for all patterns.
+"""
+from typing import Any
+import os
+import re
+
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+# Allow opting out of re2 even when it is installed
+if os.environ.get('LLAMADATASETS_USE_RE2', '1') == '0':
+    _re2 = None
+
+# Constructs that re2 rejects (lookahead/lookbehind, backreferences,
+# conditional groups), plus the Perl character classes, which re2 accepts
+# but matches ASCII-only where the stdlib matches the full Unicode classes
+_UNSUPPORTED = re.compile(r'\(\?[=!<]|\(\?P=|\\[1-9]|\\[dDsSwWbB]')
+
+
+def compile(pattern: str, flags: int = 0) -> Any:
+    """
+    Compile a regex pattern with the fastest available backend.
+
+    Args:
+        pattern: The regular expression pattern
+        flags: Standard re flags (only passed to the stdlib backend)
+
+    Returns:
+        A compiled pattern object exposing match/search/sub/findall
+    """
+    if _re2 is not None and not flags and not _UNSUPPORTED.search(pattern):
+        try:
+            return _re2.compile(pattern)
+        except _re2.error:
+            pass  # Fall back to the stdlib engine for this pattern
+    return re.compile(pattern, flags)
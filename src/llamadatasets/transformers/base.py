@@ -3,6 +3,9 @@ Base class for data transformers
 """
 from typing import Dict, Any, Callable, List, Union, Optional
 from abc import ABC, abstractmethod
+import copy
+import hashlib
+import json
 
 
 class BaseTransformer(ABC):
@@ -53,6 +56,11 @@ class BaseTransformer(ABC):
         """
         if isinstance(example_or_batch, list):
             return self.batch_transform(example_or_batch)
+        elif hasattr(example_or_batch, 'to_dict_list'):
+            # Dataset-like input: transform all examples through the batch
+            # path (which subclasses may vectorize) and rewrap the result
+            from llamadatasets.core.dataset import Dataset
+            return Dataset(self.batch_transform(example_or_batch.to_dict_list()))
         else:
             return self.transform(example_or_batch)
 
@@ -160,6 +168,90 @@ class ColumnTransformer(BaseTransformer):
         return result
 
 
+class CachedTransformer(BaseTransformer):
+    """
+    A transformer that memoizes another transformer's outputs.
+
+    Results are cached by a hash of the input example combined with a
+    fingerprint of the wrapped transformer's configuration, so rerunning an
+    idempotent transformer over repeated or unchanged inputs skips the
+    transformation entirely.
+    """
+
+    def __init__(self, transformer: BaseTransformer, max_size: Optional[int] = None):
+        """
+        Initialize the caching wrapper.
+
+        Args:
+            transformer: The transformer whose outputs should be cached
+            max_size: Optional maximum number of cached entries (the cache
+                is cleared when the limit is reached; None means unbounded)
+        """
+        self.transformer = transformer
+        self.max_size = max_size
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._config_key = self._fingerprint_config(transformer)
+
+    @staticmethod
+    def _fingerprint_config(transformer: BaseTransformer) -> str:
+        """
+        Build a stable fingerprint of a transformer's configuration.
+
+        Args:
+            transformer: The transformer to fingerprint
+
+        Returns:
+            str: Hash of the transformer's class and public attributes
+        """
+        config = {
+            name: repr(value)
+            for name, value in sorted(vars(transformer).items())
+            if not name.startswith('_')
+        }
+        config['__class__'] = type(transformer).__name__
+        return hashlib.md5(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+    def _example_key(self, example: Dict[str, Any]) -> str:
+        """
+        Build the cache key for an input example.
+
+        Args:
+            example: The input example
+
+        Returns:
+            str: Hash of the example contents and transformer config
+        """
+        payload = json.dumps(example, sort_keys=True, default=repr)
+        return hashlib.md5(f"{self._config_key}:{payload}".encode()).hexdigest()
+
+    def transform(self, example: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Transform an example, reusing a cached result when available.
+
+        Args:
+            example: The input example
+
+        Returns:
+            Dict[str, Any]: The transformed example
+        """
+        key = self._example_key(example)
+
+        if key not in self._cache:
+            if self.max_size is not None and len(self._cache) >= self.max_size:
+                self._cache.clear()
+            self._cache[key] = self.transformer.transform(example)
+
+        # Return a deep copy so callers mutating the result (including
+        # nested values like token lists) don't poison the cache
+        return copy.deepcopy(self._cache[key])
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached results.
+        """
+        self._cache.clear()
+
+
 class ChainTransformer(BaseTransformer):
     """
     A transformer that chains multiple transformers together.
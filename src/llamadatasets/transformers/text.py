@@ -2,14 +2,15 @@
 Text transformers for processing text data in datasets
 """
 from typing import Dict, Any, List, Optional, Union, Callable
-import re
 import string
 import unicodedata
+import pandas as pd
 import nltk
 from nltk.tokenize import word_tokenize
 from nltk.stem import PorterStemmer, WordNetLemmatizer
 from nltk.corpus import stopwords
 
+from llamadatasets.transformers import _regex
 from llamadatasets.transformers.base import BaseTransformer, ColumnTransformer
 
 
@@ -49,10 +50,21 @@ class TextCleanerTransformer(ColumnTransformer):
         self.remove_whitespace = remove_whitespace
         self.normalize_unicode = normalize_unicode
         self.remove_html = remove_html
-        
+
         # HTML pattern
-        self.html_pattern = re.compile(r'<.*?>')
-        
+        self.html_pattern = _regex.compile(r'<.*?>')
+
+        # Pre-compile the patterns and translation tables used in _clean_text
+        # so the per-example hot path never recompiles or rebuilds them
+        self._patterns = {}
+        if remove_html:
+            self._patterns['html'] = self.html_pattern
+        if remove_numbers:
+            self._patterns['digits'] = _regex.compile(r'\d+')
+        if remove_whitespace:
+            self._patterns['ws'] = _regex.compile(r'\s+')
+        self._punct_table = str.maketrans('', '', string.punctuation) if remove_punctuation else None
+
         # Call parent init with a function that applies all selected transformations
         super().__init__(
             columns=columns,
@@ -77,24 +89,104 @@ class TextCleanerTransformer(ColumnTransformer):
         # Apply each cleaning step if enabled
         if self.normalize_unicode:
             text = unicodedata.normalize('NFKD', text)
-        
+
         if self.remove_html:
-            text = self.html_pattern.sub('', text)
-        
+            text = self._patterns['html'].sub('', text)
+
         if self.lower:
             text = text.lower()
-        
+
         if self.remove_punctuation:
-            text = text.translate(str.maketrans('', '', string.punctuation))
-        
+            text = text.translate(self._punct_table)
+
         if self.remove_numbers:
-            text = ''.join([c for c in text if not c.isdigit()])
-        
+            text = self._patterns['digits'].sub('', text)
+
         if self.remove_whitespace:
-            text = ' '.join(text.split())
-        
+            text = self._patterns['ws'].sub(' ', text).strip()
+
         return text
 
+    def transform_series(self, column: pd.Series) -> pd.Series:
+        """
+        Apply the configured cleaners to a whole column at once.
+
+        Uses the vectorized pandas string methods so the inner loop runs in
+        native code over the column instead of dispatching per row. Intended
+        for all-string columns; non-string values are stringified and then
+        cleaned, unlike _clean_text which returns them uncleaned.
+
+        Regex steps reuse the instance's compiled stdlib patterns and the
+        punctuation step uses the same translation table, so the output
+        matches _clean_text exactly even on pandas builds whose string
+        backend would otherwise route pattern strings through RE2 (whose
+        \d and \s are ASCII-only).
+
+        Args:
+            column: Series of text values to clean
+
+        Returns:
+            pd.Series: The cleaned column
+        """
+        column = column.astype(str)
+
+        if self.normalize_unicode:
+            column = column.str.normalize('NFKD')
+
+        if self.remove_html:
+            column = column.str.replace(self.html_pattern.pattern, '', regex=True)
+
+        if self.lower:
+            column = column.str.lower()
+
+        if self.remove_punctuation:
+            column = column.str.translate(self._punct_table)
+
+        if self.remove_numbers:
+            column = column.str.replace(self._patterns['digits'], '', regex=True)
+
+        if self.remove_whitespace:
+            column = column.str.replace(self._patterns['ws'], ' ', regex=True).str.strip()
+
+        return column
+
+    def batch_transform(self, examples: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Transform a batch of examples using the vectorized column path.
+
+        Falls back to the per-example implementation when a source column is
+        missing from any example.
+
+        Args:
+            examples: List of input examples
+
+        Returns:
+            List[Dict[str, Any]]: List of transformed examples
+        """
+        if not examples or not all(
+            col in example for col in self.columns for example in examples
+        ):
+            return super().batch_transform(examples)
+
+        results = [dict(example) for example in examples]
+
+        for i, col in enumerate(self.columns):
+            target_col = self.target_columns[i]
+            values = [example[col] for example in examples]
+
+            # Vectorize only all-string columns; _clean_text early-returns
+            # str(value) uncleaned for non-string input, and the column path
+            # must match that behavior row for row
+            if all(isinstance(value, str) for value in values):
+                cleaned = self.transform_series(pd.Series(values))
+            else:
+                cleaned = [self._clean_text(value) for value in values]
+
+            for result, value in zip(results, cleaned):
+                result[target_col] = value
+
+        return results
+
 
 class TokenizerTransformer(ColumnTransformer):
     """
@@ -122,7 +214,15 @@ class TokenizerTransformer(ColumnTransformer):
         self.tokenizer_type = tokenizer
         self.language = language
         self.custom_tokenizer = custom_tokenizer
-        
+
+        # Pre-compile the fallback split pattern so it is not rebuilt per call
+        self._split_pattern = _regex.compile(r'\S+')
+
+        # Runs of word characters, or single punctuation marks, for the
+        # subword tokenizer; one native-code scan replaces the nested
+        # Python split loop
+        self._subword_pattern = _regex.compile(r'\w+|[^\w\s]')
+
         # Try to download NLTK resources if needed
         try:
             if tokenizer == 'word':
@@ -161,26 +261,13 @@ class TokenizerTransformer(ColumnTransformer):
                 return word_tokenize(text, language=self.language)
             except:
                 # Fallback to simple splitting
-                return text.split()
+                return self._split_pattern.findall(text)
         elif self.tokenizer_type == 'char':
             return list(text)
         elif self.tokenizer_type == 'subword':
-            # Simple whitespace and punctuation split
-            tokens = []
-            for word in text.split():
-                # Split by punctuation but keep it
-                for char in string.punctuation:
-                    if char in word:
-                        parts = word.split(char)
-                        for i, part in enumerate(parts):
-                            if part:
-                                tokens.append(part)
-                            if i < len(parts) - 1:
-                                tokens.append(char)
-                        break
-                else:
-                    tokens.append(word)
-            return tokens
+            # Simple whitespace and punctuation split: word-character runs
+            # and individual punctuation marks become separate tokens
+            return self._subword_pattern.findall(text)
         else:
             raise ValueError(f"Unknown tokenizer type: {self.tokenizer_type}")
 
@@ -237,6 +324,11 @@ class StopWordsRemoverTransformer(BaseTransformer):
         # Add any additional stopwords
         if additional_stopwords:
             self.stop_words.update(additional_stopwords)
+
+        # Freeze the set so membership tests in the hot loop stay O(1)
+        # against an immutable, hash-stable collection. Lowercasing here
+        # keeps the per-token check to a single hash probe.
+        self.stop_words = frozenset(word.lower() for word in self.stop_words)
     
     def transform(self, example: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -262,12 +354,50 @@ class StopWordsRemoverTransformer(BaseTransformer):
         if not isinstance(tokens, list):
             raise ValueError(f"Expected list of tokens in column '{self.column}', got {type(tokens)}")
         
-        # Remove stop words
-        filtered_tokens = [token for token in tokens if token.lower() not in self.stop_words]
-        
+        # Remove stop words (hoist the set lookup out of the loop)
+        stop_words = self.stop_words
+        filtered_tokens = [token for token in tokens if token.lower() not in stop_words]
+
         result[self.target_column] = filtered_tokens
         return result
 
+    def batch_transform(self, examples: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Remove stop words from a batch of examples.
+
+        Binds the column names and stop-word set to locals once per batch
+        so the per-token inner loop carries no attribute lookups.
+
+        Args:
+            examples: List of input examples
+
+        Returns:
+            List[Dict[str, Any]]: List of transformed examples
+        """
+        column = self.column
+        target_column = self.target_column
+        stop_words = self.stop_words
+        skip_missing = self.skip_missing
+
+        results = []
+        for example in examples:
+            result = dict(example)
+
+            if column not in example:
+                if skip_missing:
+                    results.append(result)
+                    continue
+                raise KeyError(f"Column '{column}' not found in example")
+
+            tokens = example[column]
+            if not isinstance(tokens, list):
+                raise ValueError(f"Expected list of tokens in column '{column}', got {type(tokens)}")
+
+            result[target_column] = [token for token in tokens if token.lower() not in stop_words]
+            results.append(result)
+
+        return results
+
 
 class TextStemmerTransformer(BaseTransformer):
     """
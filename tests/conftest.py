@@ -0,0 +1,5 @@
+# Make the src layout importable when the package is not installed
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'src'))
@@ -0,0 +1,24 @@
+"""
+Tests for Dataset and StreamingDataset batch iteration
+"""
+import json
+
+from llamadatasets import Dataset, StreamingDataset
+
+
+def test_iter_batches_as_columns_unions_heterogeneous_keys():
+    ds = Dataset([{'a': 1, 'b': 2}, {'a': 3}, {'a': 5, 'c': 6}])
+
+    batches = list(ds.iter_batches(batch_size=3, as_columns=True))
+
+    assert batches == [{'a': [1, 3, 5], 'b': [2, None, None], 'c': [None, None, 6]}]
+
+
+def test_streaming_as_columns_unions_heterogeneous_keys(tmp_path):
+    path = tmp_path / 'records.json'
+    path.write_text(json.dumps([{'a': 1, 'b': 2}, {'a': 3}]))
+
+    sd = StreamingDataset(source_type='json', source_path=str(path), progress_bar=False)
+    batches = list(sd.iter_batches(batch_size=2, as_columns=True))
+
+    assert batches == [{'a': [1, 3], 'b': [2, None]}]
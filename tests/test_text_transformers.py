@@ -0,0 +1,42 @@
+"""
+Tests for the text transformers and their regex backend shim
+"""
+import re
+
+from llamadatasets.transformers import TextCleanerTransformer, _regex
+
+
+def test_perl_character_classes_use_the_stdlib_backend():
+    # \d, \s and \w are Unicode-aware in the stdlib but ASCII-only in re2,
+    # so these patterns must never be handed to re2 even when installed
+    assert isinstance(_regex.compile(r'\d+'), re.Pattern)
+    assert isinstance(_regex.compile(r'\s+'), re.Pattern)
+    assert isinstance(_regex.compile(r'\S+'), re.Pattern)
+    assert isinstance(_regex.compile(r'\w+|[^\w\s]'), re.Pattern)
+
+
+def test_compiled_patterns_keep_unicode_semantics():
+    assert _regex.compile(r'\d+').sub('', 'x١٢٣y') == 'xy'
+    assert _regex.compile(r'\s+').sub(' ', 'a\u00a0\u2003b') == 'a b'
+    assert _regex.compile(r'\w+').findall('héllo ١٢٣') == [
+        'héllo', '١٢٣'
+    ]
+
+
+def test_batch_transform_matches_per_row_on_non_ascii_text():
+    # The vectorized column path must agree with _clean_text row for row,
+    # including Unicode digits and whitespace that ASCII-only \d/\s miss
+    cleaner = TextCleanerTransformer(
+        columns='text', remove_numbers=True, remove_html=True
+    )
+    texts = [
+        'unicode \u0661\u0662\u0663 digits',
+        'no\u00a0break\u2003spaces',
+        '<b>caf\u00e9</b> \ufb01ne 123',
+    ]
+    examples = [{'text': text} for text in texts]
+
+    per_row = [cleaner.transform(dict(example)) for example in examples]
+    batched = cleaner.batch_transform([dict(example) for example in examples])
+
+    assert batched == per_row